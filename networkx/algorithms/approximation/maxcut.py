@@ -1,3 +1,5 @@
+import sys
+
 import networkx as nx
 from networkx.utils.decorators import not_implemented_for, py_random_state
 
@@ -54,16 +56,13 @@ def randomized_partitioning(G, seed=None, p=0.5, weight=None):
     NetworkXNotImplemented
         If the graph is directed or is a multigraph.
     """
-    cut = {node for node in G.nodes() if seed.random() < p}
+    rand = seed.random
+    cut = {node for node in G if rand() < p}
     cut_size = nx.algorithms.cut_size(G, cut, weight=weight)
     partition = (cut, G.nodes - cut)
     return cut_size, partition
 
 
-def _swap_node_partition(cut, node):
-    return cut - {node} if node in cut else cut.union({node})
-
-
 @not_implemented_for("directed")
 @not_implemented_for("multigraph")
 @py_random_state(2)
@@ -118,26 +117,57 @@ def one_exchange(G, initial_cut=None, seed=None, weight=None):
     if initial_cut is None:
         initial_cut = set()
     cut = set(initial_cut)
-    current_cut_size = nx.algorithms.cut_size(G, cut, weight=weight)
+
+    # The edge weights are looked up once; self-loops never cross the cut.
+    nbr_weights = {
+        v: [(u, d.get(weight, 1)) for u, d in nbrs.items() if u != v]
+        for v, nbrs in G._adj.items()
+    }
+
+    def swap_gain(v):
+        # The change in cut value caused by moving `v` to the other partition.
+        v_in_cut = v in cut
+        gain = 0
+        for u, wt in nbr_weights[v]:
+            gain += wt if (u in cut) == v_in_cut else -wt
+        return gain
+
+    # Swapping a node only changes its own gain and the gains of its
+    # neighbors, so the gains are computed once and then kept up to date.
+    gains = {v: swap_gain(v) for v in G}
     while True:
         nodes = list(G.nodes())
         # Shuffling the nodes ensures random tie-breaks in the following call to max
         seed.shuffle(nodes)
-        best_node_to_swap = max(
-            nodes,
-            key=lambda v: nx.algorithms.cut_size(
-                G, _swap_node_partition(cut, v), weight=weight
-            ),
-            default=None,
+        best_node_to_swap = max(nodes, key=gains.__getitem__, default=None)
+        if best_node_to_swap is None or gains[best_node_to_swap] <= 0:
+            break
+        # The incremental updates accumulate rounding errors with float
+        # weights, so the gain is recomputed before the swap is accepted.
+        # A gain within rounding error of zero is not an improvement; this
+        # keeps every swap strictly increasing the cut, so the loop ends.
+        nbr_wts = nbr_weights[best_node_to_swap]
+        gain = swap_gain(best_node_to_swap)
+        tol = (len(nbr_wts) + 1) * sys.float_info.epsilon * sum(
+            abs(wt) for _, wt in nbr_wts
         )
-        potential_cut = _swap_node_partition(cut, best_node_to_swap)
-        potential_cut_size = nx.algorithms.cut_size(G, potential_cut, weight=weight)
-
-        if potential_cut_size > current_cut_size:
-            cut = potential_cut
-            current_cut_size = potential_cut_size
-        else:
+        if gain <= tol:
             break
+        if best_node_to_swap in cut:
+            cut.remove(best_node_to_swap)
+            v_in_cut = False
+        else:
+            cut.add(best_node_to_swap)
+            v_in_cut = True
+        gains[best_node_to_swap] = -gain
+        # Each edge to a neighbor flips between crossing and not crossing the
+        # cut, which changes the neighbor's gain by twice the edge weight.
+        for u, wt in nbr_wts:
+            if (u in cut) == v_in_cut:
+                gains[u] += 2 * wt
+            else:
+                gains[u] -= 2 * wt
 
+    current_cut_size = nx.algorithms.cut_size(G, cut, weight=weight)
     partition = (cut, G.nodes - cut)
     return current_cut_size, partition
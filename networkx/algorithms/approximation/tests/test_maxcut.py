@@ -92,3 +92,34 @@ def test_negative_weights():
     _cut_is_locally_optimal(G, cut_size, set1)
     # test that all nodes are in the same partition
     assert len(set1) == len(G.nodes) or len(set2) == len(G.nodes)
+
+
+def test_one_exchange_zero_gain_float_weights():
+    # Moving node 0 gains 0.1 + 0.2 - 0.3, which is zero but does not round
+    # to zero, so it must not be taken as an improvement.
+    G = nx.Graph()
+    G.add_edge(0, 1, weight=0.1)
+    G.add_edge(0, 2, weight=0.2)
+    G.add_edge(0, 3, weight=0.3)
+    G.add_edge(1, 3, weight=1)
+    G.add_edge(2, 3, weight=1)
+
+    cut_size, (set1, set2) = maxcut.one_exchange(
+        G, initial_cut={3}, weight="weight", seed=1
+    )
+    assert set1 == {3}
+    assert cut_size == pytest.approx(2.3)
+
+
+def test_one_exchange_float_weights_seeded():
+    G = nx.gnp_random_graph(40, 0.1, seed=14)
+    rng = random.Random(14)
+    for u, v, w in G.edges(data=True):
+        w["weight"] = rng.choice([0.1, 0.2, 0.3, 0.7, 1.1])
+
+    cut_size, (set1, set2) = maxcut.one_exchange(G, weight="weight", seed=14)
+
+    _is_valid_cut(G, set1, set2)
+    _cut_is_locally_optimal(G, cut_size, set1)
+    assert cut_size == pytest.approx(31.2)
+    assert set1 == {0, 1, 4, 6, 8, 10, 13, 14, 16, 17, 20, 22, 24, 26, 29, 30, 34, 38}
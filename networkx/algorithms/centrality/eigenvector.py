@@ -173,22 +173,31 @@ def eigenvector_centrality(G, max_iter=100, tol=1.0e-6, nstart=None, weight=None
     x = {k: v / nstart_sum for k, v in nstart.items()}
     nnodes = G.number_of_nodes()
     # make up to max_iter iterations
+    adj = G._adj
     for _ in range(max_iter):
         xlast = x
         x = xlast.copy()  # Start with xlast times I to iterate with (A+I)
         # do the multiplication y^T = x^T A (left eigenvector)
-        for n in x:
-            for nbr in G[n]:
-                w = G[n][nbr].get(weight, 1) if weight else 1
-                x[nbr] += xlast[n] * w
+        # The weighted and unweighted cases are split so that the check on
+        # `weight` is done once per iteration rather than once per edge.
+        if not weight:
+            for n, xl in xlast.items():
+                for nbr in adj[n]:
+                    x[nbr] += xl
+        else:
+            for n, xl in xlast.items():
+                for nbr, d in adj[n].items():
+                    x[nbr] += xl * d.get(weight, 1)
         # Normalize the vector. The normalization denominator `norm`
         # should never be zero by the Perron--Frobenius
         # theorem. However, in case it is due to numerical error, we
         # assume the norm to be one instead.
         norm = math.hypot(*x.values()) or 1
         x = {k: v / norm for k, v in x.items()}
-        # Check for convergence (in the L_1 norm).
-        if sum(abs(x[n] - xlast[n]) for n in x) < nnodes * tol:
+        # Check for convergence (in the L_1 norm). `x` and `xlast` have the
+        # same key order, so their values can be compared without lookups.
+        err = sum(abs(a - b) for a, b in zip(x.values(), xlast.values()))
+        if err < nnodes * tol:
             return x
     raise nx.PowerIterationFailedConvergence(max_iter)
 
@@ -233,7 +242,8 @@ def eigenvector_centrality_numpy(G, weight=None, max_iter=50, tol=0):
       A networkx graph.
 
     max_iter : integer, optional (default=50)
-      Maximum number of Arnoldi update iterations allowed.
+      Maximum number of Arnoldi (or, for undirected graphs, Lanczos)
+      update iterations allowed.
 
     tol : float, optional (default=0)
       Relative accuracy for eigenvalues (stopping criterion).
@@ -271,6 +281,7 @@ def eigenvector_centrality_numpy(G, weight=None, max_iter=50, tol=0):
     See Also
     --------
     :func:`scipy.sparse.linalg.eigs`
+    :func:`scipy.sparse.linalg.eigsh`
     eigenvector_centrality
     :func:`~networkx.algorithms.link_analysis.pagerank_alg.pagerank`
     :func:`~networkx.algorithms.link_analysis.hits_alg.hits`
@@ -292,7 +303,9 @@ def eigenvector_centrality_numpy(G, weight=None, max_iter=50, tol=0):
     This implementation uses the
     :func:`SciPy sparse eigenvalue solver<scipy.sparse.linalg.eigs>` (ARPACK)
     to find the largest eigenvalue/eigenvector pair using Arnoldi iterations
-    [7]_.
+    [7]_. For undirected graphs the adjacency matrix is symmetric, and the
+    :func:`symmetric solver<scipy.sparse.linalg.eigsh>` based on Lanczos
+    iterations [8]_ is used instead.
 
     References
     ----------
@@ -324,6 +337,8 @@ def eigenvector_centrality_numpy(G, weight=None, max_iter=50, tol=0):
 
     .. [7] Arnoldi iteration:: https://en.wikipedia.org/wiki/Arnoldi_iteration
 
+    .. [8] Lanczos algorithm:: https://en.wikipedia.org/wiki/Lanczos_algorithm
+
     """
     import numpy as np
     import scipy as sp
@@ -333,9 +348,16 @@ def eigenvector_centrality_numpy(G, weight=None, max_iter=50, tol=0):
             "cannot compute centrality for the null graph"
         )
     M = nx.to_scipy_sparse_array(G, nodelist=list(G), weight=weight, dtype=float)
-    _, eigenvector = sp.sparse.linalg.eigs(
-        M.T, k=1, which="LR", maxiter=max_iter, tol=tol
-    )
+    if G.is_directed():
+        _, eigenvector = sp.sparse.linalg.eigs(
+            M.T, k=1, which="LR", maxiter=max_iter, tol=tol
+        )
+    else:
+        # M is symmetric, so the Lanczos solver can be used; unlike eigs,
+        # which requires k < N - 1, it also handles graphs with two nodes.
+        _, eigenvector = sp.sparse.linalg.eigsh(
+            M, k=1, which="LA", maxiter=max_iter, tol=tol
+        )
     largest = eigenvector.flatten().real
     norm = np.sign(largest.sum()) * sp.linalg.norm(largest)
     return dict(zip(G, (largest / norm).tolist()))
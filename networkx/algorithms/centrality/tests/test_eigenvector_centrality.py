@@ -46,6 +46,13 @@ class TestEigenvectorCentrality:
         for n in sorted(G):
             assert b[n] == pytest.approx(b_answer[n], abs=1e-4)
 
+    def test_P2_numpy(self):
+        """Eigenvector centrality: P2 (too small for the general ARPACK solver)"""
+        G = nx.path_graph(2)
+        b = nx.eigenvector_centrality_numpy(G)
+        for n in sorted(G):
+            assert b[n] == pytest.approx(math.sqrt(1 / 2.0), abs=1e-7)
+
     def test_maxiter(self):
         with pytest.raises(nx.PowerIterationFailedConvergence):
             G = nx.path_graph(3)
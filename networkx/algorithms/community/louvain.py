@@ -5,7 +5,6 @@ import itertools
 from collections import defaultdict, deque
 
 import networkx as nx
-from networkx.algorithms.community import modularity
 from networkx.utils import py_random_state
 
 __all__ = ["louvain_communities", "louvain_partitions"]
@@ -193,7 +192,6 @@ def louvain_partitions(
     if nx.is_empty(G):
         yield partition
         return
-    mod = modularity(G, partition, resolution=resolution, weight=weight)
     is_directed = G.is_directed()
     if G.is_multigraph():
         graph = _convert_multigraph(G, weight, is_directed)
@@ -203,168 +201,302 @@ def louvain_partitions(
         graph.add_weighted_edges_from(G.edges(data=weight, default=1))
 
     m = graph.size(weight="weight")
-    partition, inner_partition, improvement = _one_level(
-        graph, m, partition, resolution, is_directed, seed
+    # The graph of each level is kept as lists of adjacency dicts indexed by
+    # node position; see `_adjacency_lists`.
+    succ, pred = _adjacency_lists(graph, is_directed)
+    partition, node2com, delta_q = _one_level(
+        succ, pred, m, partition, resolution, is_directed, seed
     )
     improvement = True
     while improvement:
         # gh-5901 protect the sets in the yielded list from further manipulation here
         yield [s.copy() for s in partition]
-        new_mod = modularity(
-            graph, inner_partition, resolution=resolution, weight="weight"
-        )
-        if new_mod - mod <= threshold:
+        # `delta_q` is the modularity gain of this level, accumulated from the
+        # gains of the individual moves, so modularity need not be recomputed.
+        if delta_q <= threshold:
             return
-        mod = new_mod
-        graph = _gen_graph(graph, inner_partition)
-        partition, inner_partition, improvement = _one_level(
-            graph, m, partition, resolution, is_directed, seed
+        succ, pred = _gen_graph(succ, node2com, len(partition), is_directed)
+        partition, node2com, delta_q = _one_level(
+            succ, pred, m, partition, resolution, is_directed, seed
         )
+        improvement = delta_q > 0
 
 
-def _one_level(G, m, partition, resolution=1, is_directed=False, seed=None):
+def _one_level(succ, pred, m, partition, resolution=1, is_directed=False, seed=None):
     """Calculate one level of the Louvain partitions tree
 
     Parameters
     ----------
-    G : NetworkX Graph/DiGraph
-        The graph from which to detect communities
+    succ : list of dicts
+        The graph from which to detect communities, given as its successors
+        (or neighbors, if undirected) in the format of `_adjacency_lists`.
+    pred : list of dicts or None
+        The predecessors of each node if the graph is directed, else None.
     m : number
-        The size of the graph `G`.
+        The size of the graph.
     partition : list of sets of nodes
-        A valid partition of the graph `G`
+        The nodes of the original graph that each node of the graph stands
+        for.
     resolution : positive number
         The resolution parameter for computing the modularity of a partition
     is_directed : bool
-        True if `G` is a directed graph.
+        True if the graph is directed.
     seed : integer, random_state, or None (default)
         Indicator of random number generation state.
         See :ref:`Randomness<randomness>`.
 
+    Returns
+    -------
+    partition : list of sets of nodes
+        The new partition of the nodes of the original graph.
+    node2com : list
+        The index in the new partition of the community of each node.
+    delta_q : float
+        The modularity gain achieved by the moves made at this level.
+
     """
-    node2com = {u: i for i, u in enumerate(G.nodes())}
-    inner_partition = [{u} for u in G.nodes()]
+    n = len(succ)
+    node2com = list(range(n))
     if is_directed:
-        in_degrees = dict(G.in_degree(weight="weight"))
-        out_degrees = dict(G.out_degree(weight="weight"))
-        Stot_in = list(in_degrees.values())
-        Stot_out = list(out_degrees.values())
+        in_degrees = [sum(adj.values()) for adj in pred]
+        out_degrees = [sum(adj.values()) for adj in succ]
+        Stot_in = in_degrees.copy()
+        Stot_out = out_degrees.copy()
         # Calculate weights for both in and out neighbors without considering self-loops
-        nbrs = {}
-        for u in G:
-            nbrs[u] = defaultdict(float)
-            for _, n, wt in G.out_edges(u, data="weight"):
-                if u != n:
-                    nbrs[u][n] += wt
-            for n, _, wt in G.in_edges(u, data="weight"):
-                if u != n:
-                    nbrs[u][n] += wt
+        nbrs = []
+        for u in range(n):
+            wts = defaultdict(float)
+            for v, wt in succ[u].items():
+                if u != v:
+                    wts[v] += wt
+            for v, wt in pred[u].items():
+                if u != v:
+                    wts[v] += wt
+            nbrs.append(wts)
     else:
-        degrees = dict(G.degree(weight="weight"))
-        Stot = list(degrees.values())
-        nbrs = {u: {v: data["weight"] for v, data in G[u].items() if v != u} for u in G}
-    rand_nodes = list(G.nodes)
-    seed.shuffle(rand_nodes)
+        # Self-loops count twice towards the degree.
+        degrees = [sum(adj.values()) + adj.get(u, 0) for u, adj in enumerate(succ)]
+        Stot = degrees.copy()
+        # The adjacency dicts are used as they are (the sweep only reads
+        # them) unless a self-loop has to be left out.
+        nbrs = [
+            adj if u not in adj else {v: wt for v, wt in adj.items() if v != u}
+            for u, adj in enumerate(succ)
+        ]
+    order = list(range(n))
+    seed.shuffle(order)
     nb_moves = 1
-    improvement = False
+    delta_q = 0
     while nb_moves > 0:
-        nb_moves = 0
-        for u in rand_nodes:
-            best_mod = 0
-            best_com = node2com[u]
-            weights2com = _neighbor_weights(nbrs[u], node2com)
-            if is_directed:
-                in_degree = in_degrees[u]
-                out_degree = out_degrees[u]
-                Stot_in[best_com] -= in_degree
-                Stot_out[best_com] -= out_degree
-                remove_cost = (
-                    -weights2com[best_com] / m
-                    + resolution
-                    * (out_degree * Stot_in[best_com] + in_degree * Stot_out[best_com])
-                    / m**2
-                )
-            else:
-                degree = degrees[u]
-                Stot[best_com] -= degree
-                remove_cost = -weights2com[best_com] / m + resolution * (
-                    Stot[best_com] * degree
-                ) / (2 * m**2)
-            for nbr_com, wt in weights2com.items():
-                if is_directed:
-                    gain = (
-                        remove_cost
-                        + wt / m
-                        - resolution
-                        * (
-                            out_degree * Stot_in[nbr_com]
-                            + in_degree * Stot_out[nbr_com]
-                        )
-                        / m**2
-                    )
-                else:
-                    gain = (
-                        remove_cost
-                        + wt / m
-                        - resolution * (Stot[nbr_com] * degree) / (2 * m**2)
-                    )
-                if gain > best_mod:
-                    best_mod = gain
-                    best_com = nbr_com
-            if is_directed:
-                Stot_in[best_com] += in_degree
-                Stot_out[best_com] += out_degree
+        if is_directed:
+            nb_moves, gain = _directed_sweep(
+                order,
+                nbrs,
+                node2com,
+                in_degrees,
+                out_degrees,
+                Stot_in,
+                Stot_out,
+                m,
+                resolution,
+            )
+        else:
+            nb_moves, gain = _undirected_sweep(
+                order, nbrs, node2com, degrees, Stot, m, resolution
+            )
+        delta_q += gain
+    # Only `node2com` is maintained during the sweeps; the communities are
+    # built once from it here, and renumbered from 0 in the same pass.
+    members = [[] for _ in range(n)]
+    for i, com in enumerate(node2com):
+        members[com].append(i)
+    new_partition = []
+    for com_members in members:
+        if com_members:
+            for i in com_members:
+                node2com[i] = len(new_partition)
+            new_partition.append(set().union(*(partition[i] for i in com_members)))
+    return new_partition, node2com, delta_q
+
+
+def _undirected_sweep(order, nbrs, node2com, degrees, Stot, m, resolution):
+    """Move each node in `order` to the neighbor community with the best
+    modularity gain, for an undirected graph.
+
+    All arguments describing the graph are lists indexed by node index (see
+    `_one_level`). `node2com` and `Stot` are updated in place; the neighbor
+    dicts in `nbrs` may be shared with the graph and are only read.
+
+    Returns the number of moves made and their total modularity gain.
+    """
+    # Scratch space for the weights from a node to its neighbor communities.
+    # `touched` records, in first-seen order, which entries have to be
+    # visited and cleared again once the node has been processed.
+    weights2com = [None] * len(node2com)
+    touched = []
+    nb_moves = 0
+    total_gain = 0
+    two_m_sq = 2 * m**2
+    for i in order:
+        best_mod = 0
+        best_com = old_com = node2com[i]
+        for v, wt in nbrs[i].items():
+            com = node2com[v]
+            com_wt = weights2com[com]
+            if com_wt is None:
+                touched.append(com)
+                weights2com[com] = wt
             else:
-                Stot[best_com] += degree
-            if best_com != node2com[u]:
-                com = G.nodes[u].get("nodes", {u})
-                partition[node2com[u]].difference_update(com)
-                inner_partition[node2com[u]].remove(u)
-                partition[best_com].update(com)
-                inner_partition[best_com].add(u)
-                improvement = True
-                nb_moves += 1
-                node2com[u] = best_com
-    partition = list(filter(len, partition))
-    inner_partition = list(filter(len, inner_partition))
-    return partition, inner_partition, improvement
-
-
-def _neighbor_weights(nbrs, node2com):
-    """Calculate weights between node and its neighbor communities.
+                weights2com[com] = com_wt + wt
+        degree = degrees[i]
+        Stot[old_com] -= degree
+        remove_cost = (
+            -(weights2com[old_com] or 0) / m
+            + resolution * (Stot[old_com] * degree) / two_m_sq
+        )
+        for nbr_com in touched:
+            wt = weights2com[nbr_com]
+            weights2com[nbr_com] = None
+            gain = (
+                remove_cost + wt / m - resolution * (Stot[nbr_com] * degree) / two_m_sq
+            )
+            if gain > best_mod:
+                best_mod = gain
+                best_com = nbr_com
+        touched.clear()
+        Stot[best_com] += degree
+        if best_com != old_com:
+            node2com[i] = best_com
+            nb_moves += 1
+            total_gain += best_mod
+    return nb_moves, total_gain
+
+
+def _directed_sweep(
+    order,
+    nbrs,
+    node2com,
+    in_degrees,
+    out_degrees,
+    Stot_in,
+    Stot_out,
+    m,
+    resolution,
+):
+    """Move each node in `order` to the neighbor community with the best
+    modularity gain, for a directed graph.
 
-    Parameters
-    ----------
-    nbrs : dictionary
-           Dictionary with nodes' neighbors as keys and their edge weight as value.
-    node2com : dictionary
-           Dictionary with all graph's nodes as keys and their community index as value.
+    All arguments describing the graph are lists indexed by node index (see
+    `_one_level`). `node2com`, `Stot_in` and `Stot_out` are updated in place;
+    the neighbor dicts in `nbrs` are only read.
 
+    Returns the number of moves made and their total modularity gain.
     """
-    weights = defaultdict(float)
-    for nbr, wt in nbrs.items():
-        weights[node2com[nbr]] += wt
-    return weights
-
-
-def _gen_graph(G, partition):
-    """Generate a new graph based on the partitions of a given graph"""
-    H = G.__class__()
-    node2com = {}
-    for i, part in enumerate(partition):
-        nodes = set()
-        for node in part:
-            node2com[node] = i
-            nodes.update(G.nodes[node].get("nodes", {node}))
-        H.add_node(i, nodes=nodes)
-
-    for node1, node2, wt in G.edges(data=True):
-        wt = wt["weight"]
-        com1 = node2com[node1]
-        com2 = node2com[node2]
-        temp = H.get_edge_data(com1, com2, {"weight": 0})["weight"]
-        H.add_edge(com1, com2, weight=wt + temp)
-    return H
+    weights2com = [None] * len(node2com)
+    touched = []
+    nb_moves = 0
+    total_gain = 0
+    m_sq = m**2
+    for i in order:
+        best_mod = 0
+        best_com = old_com = node2com[i]
+        for v, wt in nbrs[i].items():
+            com = node2com[v]
+            com_wt = weights2com[com]
+            if com_wt is None:
+                touched.append(com)
+                weights2com[com] = wt
+            else:
+                weights2com[com] = com_wt + wt
+        in_degree = in_degrees[i]
+        out_degree = out_degrees[i]
+        Stot_in[old_com] -= in_degree
+        Stot_out[old_com] -= out_degree
+        remove_cost = (
+            -(weights2com[old_com] or 0) / m
+            + resolution
+            * (out_degree * Stot_in[old_com] + in_degree * Stot_out[old_com])
+            / m_sq
+        )
+        for nbr_com in touched:
+            wt = weights2com[nbr_com]
+            weights2com[nbr_com] = None
+            gain = (
+                remove_cost
+                + wt / m
+                - resolution
+                * (out_degree * Stot_in[nbr_com] + in_degree * Stot_out[nbr_com])
+                / m_sq
+            )
+            if gain > best_mod:
+                best_mod = gain
+                best_com = nbr_com
+        touched.clear()
+        Stot_in[best_com] += in_degree
+        Stot_out[best_com] += out_degree
+        if best_com != old_com:
+            node2com[i] = best_com
+            nb_moves += 1
+            total_gain += best_mod
+    return nb_moves, total_gain
+
+
+def _adjacency_lists(G, is_directed):
+    """Return the adjacency of `G` as lists of dicts indexed by node position.
+
+    The returned ``succ[i]`` maps the position of each successor (neighbor,
+    if `G` is undirected) of the i-th node of `G` to the "weight" of the
+    edge. ``pred`` holds the predecessors in the same way if `G` is
+    directed and is None otherwise.
+    """
+    index = {u: i for i, u in enumerate(G)}
+    succ = [
+        {index[v]: data["weight"] for v, data in nbrs.items()}
+        for nbrs in G._adj.values()
+    ]
+    if not is_directed:
+        return succ, None
+    pred = [
+        {index[v]: data["weight"] for v, data in nbrs.items()}
+        for nbrs in G._pred.values()
+    ]
+    return succ, pred
+
+
+def _gen_graph(succ, node2com, n_coms, is_directed):
+    """Generate the graph of the communities of a given graph
+
+    The graph is given and returned in the format of `_adjacency_lists`.
+    """
+    # Accumulate the weights between communities in a flat dict, visiting
+    # each edge exactly once.
+    com_weights = {}
+    if is_directed:
+        for u, nbrs in enumerate(succ):
+            com1 = node2com[u]
+            for v, wt in nbrs.items():
+                key = (com1, node2com[v])
+                com_weights[key] = com_weights.get(key, 0) + wt
+    else:
+        for u, nbrs in enumerate(succ):
+            com1 = node2com[u]
+            for v, wt in nbrs.items():
+                if v < u:
+                    continue
+                com2 = node2com[v]
+                key = (com1, com2) if com1 <= com2 else (com2, com1)
+                com_weights[key] = com_weights.get(key, 0) + wt
+    new_succ = [{} for _ in range(n_coms)]
+    if not is_directed:
+        for (com1, com2), wt in com_weights.items():
+            new_succ[com1][com2] = wt
+            new_succ[com2][com1] = wt
+        return new_succ, None
+    new_pred = [{} for _ in range(n_coms)]
+    for (com1, com2), wt in com_weights.items():
+        new_succ[com1][com2] = wt
+        new_pred[com2][com1] = wt
+    return new_succ, new_pred
 
 
 def _convert_multigraph(G, weight, is_directed):
@@ -239,6 +239,17 @@ def test_threshold():
     assert mod1 <= mod2
 
 
+def test_partitions_modularity_increase():
+    G = nx.LFR_benchmark_graph(
+        250, 3, 1.5, 0.009, average_degree=5, min_community=20, seed=10
+    )
+    for H in (G, G.to_directed()):
+        partitions = list(nx.community.louvain_partitions(H, seed=42))
+        mods = [nx.community.modularity(H, p) for p in partitions]
+        assert len(mods) > 1
+        assert all(m1 < m2 for m1, m2 in zip(mods, mods[1:]))
+
+
 def test_empty_graph():
     G = nx.Graph()
     G.add_nodes_from(range(5))
@@ -53,7 +53,15 @@ def moral_graph(G):
            in artificial intelligence (UAI'95)
     """
     H = G.to_undirected()
-    for preds in G.pred.values():
-        predecessors_combinations = itertools.combinations(preds, r=2)
-        H.add_edges_from(predecessors_combinations)
+    moral_edges = (
+        (u, v)
+        for preds in G._pred.values()
+        for u, v in itertools.combinations(preds, r=2)
+    )
+    if not H.is_multigraph():
+        # Parents that are already adjacent (in G or through another shared
+        # child) are skipped rather than re-added.
+        H_adj = H._adj
+        moral_edges = ((u, v) for u, v in moral_edges if v not in H_adj[u])
+    H.add_edges_from(moral_edges)
     return H
@@ -1,4 +1,5 @@
 import os
+from collections import Counter
 
 import pytest
 
@@ -7,12 +8,53 @@ from networkx.classes.tests import dispatch_interface
 from networkx.utils import edges_equal
 
 
-def test_union_attributes():
+@pytest.fixture
+def attr_graph():
+    """Two-node graph with node, edge and graph attributes."""
     g = nx.Graph()
     g.add_node(0, x=4)
     g.add_node(1, x=5)
     g.add_edge(0, 1, size=5)
     g.graph["name"] = "g"
+    return g
+
+
+@pytest.fixture
+def base_multi_graph():
+    """Multigraph with keys 0, 1, 2 on edge (0, 1)."""
+    g = nx.MultiGraph()
+    g.add_edge(0, 1, key=0)
+    g.add_edge(0, 1, key=1)
+    g.add_edge(0, 1, key=2)
+    return g
+
+
+@pytest.fixture
+def other_multi_graph():
+    """Multigraph with keys 0, 3 on edge (0, 1)."""
+    h = nx.MultiGraph()
+    h.add_edge(0, 1, key=0)
+    h.add_edge(0, 1, key=3)
+    return h
+
+
+@pytest.fixture(scope="module")
+def path3():
+    return nx.path_graph(3)
+
+
+@pytest.fixture(scope="module")
+def path4():
+    return nx.path_graph(4)
+
+
+@pytest.fixture(scope="module")
+def k3():
+    return nx.complete_graph(3)
+
+
+def test_union_attributes(attr_graph):
+    g = attr_graph
 
     h = g.copy()
     h.graph["name"] = "h"
@@ -21,9 +63,10 @@ def test_union_attributes():
 
     gh = nx.union(g, h, rename=("g", "h"))
     assert set(gh.nodes()) == {"h0", "h1", "g0", "g1"}
+    graphs = {"g": g, "h": h}
     for n in gh:
         graph, node = n
-        assert gh.nodes[n] == eval(graph).nodes[int(node)]
+        assert gh.nodes[n] == graphs[graph].nodes[int(node)]
 
     assert gh.graph["attr"] == "attr"
     assert gh.graph["name"] == "h"  # h graph attributes take precedent
@@ -40,7 +83,7 @@ def test_intersection():
     H.add_edge(3, 4)
     I = nx.intersection(G, H)
     assert set(I.nodes()) == {1, 2, 3, 4}
-    assert sorted(I.edges()) == [(2, 3)]
+    assert set(I.edges()) == {(2, 3)}
 
     ##################
     # Tests for @nx._dispatchable mechanism with multiple graph arguments
@@ -51,7 +94,7 @@ def test_intersection():
     H2 = dispatch_interface.convert(H)
     I2 = nx.intersection(G2, H2)
     assert set(I2.nodes()) == {1, 2, 3, 4}
-    assert sorted(I2.edges()) == [(2, 3)]
+    assert set(I2.edges()) == {(2, 3)}
     # Only test if not performing auto convert testing of backend implementations
     if not nx.config["backend_priority"]:
         with pytest.raises(TypeError):
@@ -72,15 +115,11 @@ def test_intersection_node_sets_different():
     H.add_edge(5, 6)
     I = nx.intersection(G, H)
     assert set(I.nodes()) == {1, 2, 3, 4}
-    assert sorted(I.edges()) == [(2, 3)]
+    assert set(I.edges()) == {(2, 3)}
 
 
-def test_intersection_attributes():
-    g = nx.Graph()
-    g.add_node(0, x=4)
-    g.add_node(1, x=5)
-    g.add_edge(0, 1, size=5)
-    g.graph["name"] = "g"
+def test_intersection_attributes(attr_graph):
+    g = attr_graph
 
     h = g.copy()
     h.graph["name"] = "h"
@@ -90,16 +129,12 @@ def test_intersection_attributes():
 
     assert set(gh.nodes()) == set(g.nodes())
     assert set(gh.nodes()) == set(h.nodes())
-    assert sorted(gh.edges()) == sorted(g.edges())
+    assert set(gh.edges()) == set(g.edges())
 
 
-def test_intersection_attributes_node_sets_different():
-    g = nx.Graph()
-    g.add_node(0, x=4)
-    g.add_node(1, x=5)
+def test_intersection_attributes_node_sets_different(attr_graph):
+    g = attr_graph
     g.add_node(2, x=3)
-    g.add_edge(0, 1, size=5)
-    g.graph["name"] = "g"
 
     h = g.copy()
     h.graph["name"] = "h"
@@ -109,38 +144,30 @@ def test_intersection_attributes_node_sets_different():
 
     gh = nx.intersection(g, h)
     assert set(gh.nodes()) == set(h.nodes())
-    assert sorted(gh.edges()) == sorted(g.edges())
+    assert set(gh.edges()) == set(g.edges())
 
 
-def test_intersection_multigraph_attributes():
-    g = nx.MultiGraph()
-    g.add_edge(0, 1, key=0)
-    g.add_edge(0, 1, key=1)
-    g.add_edge(0, 1, key=2)
-    h = nx.MultiGraph()
-    h.add_edge(0, 1, key=0)
-    h.add_edge(0, 1, key=3)
+def test_intersection_multigraph_attributes(base_multi_graph, other_multi_graph):
+    g = base_multi_graph
+    h = other_multi_graph
     gh = nx.intersection(g, h)
     assert set(gh.nodes()) == set(g.nodes())
     assert set(gh.nodes()) == set(h.nodes())
-    assert sorted(gh.edges()) == [(0, 1)]
-    assert sorted(gh.edges(keys=True)) == [(0, 1, 0)]
+    assert set(gh.edges()) == {(0, 1)}
+    assert set(gh.edges(keys=True)) == {(0, 1, 0)}
 
 
-def test_intersection_multigraph_attributes_node_set_different():
-    g = nx.MultiGraph()
-    g.add_edge(0, 1, key=0)
-    g.add_edge(0, 1, key=1)
-    g.add_edge(0, 1, key=2)
+def test_intersection_multigraph_attributes_node_set_different(
+    base_multi_graph, other_multi_graph
+):
+    g = base_multi_graph
     g.add_edge(0, 2, key=2)
     g.add_edge(0, 2, key=1)
-    h = nx.MultiGraph()
-    h.add_edge(0, 1, key=0)
-    h.add_edge(0, 1, key=3)
+    h = other_multi_graph
     gh = nx.intersection(g, h)
     assert set(gh.nodes()) == set(h.nodes())
-    assert sorted(gh.edges()) == [(0, 1)]
-    assert sorted(gh.edges(keys=True)) == [(0, 1, 0)]
+    assert set(gh.edges()) == {(0, 1)}
+    assert set(gh.edges(keys=True)) == {(0, 1, 0)}
 
 
 def test_difference():
@@ -154,13 +181,13 @@ def test_difference():
     H.add_edge(3, 4)
     D = nx.difference(G, H)
     assert set(D.nodes()) == {1, 2, 3, 4}
-    assert sorted(D.edges()) == [(1, 2)]
+    assert set(D.edges()) == {(1, 2)}
     D = nx.difference(H, G)
     assert set(D.nodes()) == {1, 2, 3, 4}
-    assert sorted(D.edges()) == [(3, 4)]
+    assert set(D.edges()) == {(3, 4)}
     D = nx.symmetric_difference(G, H)
     assert set(D.nodes()) == {1, 2, 3, 4}
-    assert sorted(D.edges()) == [(1, 2), (3, 4)]
+    assert set(D.edges()) == {(1, 2), (3, 4)}
 
 
 def test_difference2():
@@ -173,22 +200,18 @@ def test_difference2():
     G.add_edge(2, 3)
     D = nx.difference(G, H)
     assert set(D.nodes()) == {1, 2, 3, 4}
-    assert sorted(D.edges()) == [(2, 3)]
+    assert set(D.edges()) == {(2, 3)}
     D = nx.difference(H, G)
     assert set(D.nodes()) == {1, 2, 3, 4}
-    assert sorted(D.edges()) == []
+    assert len(D.edges()) == 0
     H.add_edge(3, 4)
     D = nx.difference(H, G)
     assert set(D.nodes()) == {1, 2, 3, 4}
-    assert sorted(D.edges()) == [(3, 4)]
+    assert set(D.edges()) == {(3, 4)}
 
 
-def test_difference_attributes():
-    g = nx.Graph()
-    g.add_node(0, x=4)
-    g.add_node(1, x=5)
-    g.add_edge(0, 1, size=5)
-    g.graph["name"] = "g"
+def test_difference_attributes(attr_graph):
+    g = attr_graph
 
     h = g.copy()
     h.graph["name"] = "h"
@@ -198,57 +221,44 @@ def test_difference_attributes():
     gh = nx.difference(g, h)
     assert set(gh.nodes()) == set(g.nodes())
     assert set(gh.nodes()) == set(h.nodes())
-    assert sorted(gh.edges()) == []
+    assert len(gh.edges()) == 0
     # node and graph data should not be copied over
     assert gh.nodes.data() != g.nodes.data()
     assert gh.graph != g.graph
 
 
-def test_difference_multigraph_attributes():
-    g = nx.MultiGraph()
-    g.add_edge(0, 1, key=0)
-    g.add_edge(0, 1, key=1)
-    g.add_edge(0, 1, key=2)
-    h = nx.MultiGraph()
-    h.add_edge(0, 1, key=0)
-    h.add_edge(0, 1, key=3)
+def test_difference_multigraph_attributes(base_multi_graph, other_multi_graph):
+    g = base_multi_graph
+    h = other_multi_graph
     gh = nx.difference(g, h)
     assert set(gh.nodes()) == set(g.nodes())
     assert set(gh.nodes()) == set(h.nodes())
-    assert sorted(gh.edges()) == [(0, 1), (0, 1)]
-    assert sorted(gh.edges(keys=True)) == [(0, 1, 1), (0, 1, 2)]
+    assert Counter(gh.edges()) == Counter([(0, 1), (0, 1)])
+    assert set(gh.edges(keys=True)) == {(0, 1, 1), (0, 1, 2)}
 
 
-def test_difference_raise():
-    G = nx.path_graph(4)
-    H = nx.path_graph(3)
-    pytest.raises(nx.NetworkXError, nx.difference, G, H)
-    pytest.raises(nx.NetworkXError, nx.symmetric_difference, G, H)
+def test_difference_raise(path4, path3):
+    with pytest.raises(nx.NetworkXError, match="Node sets of graphs not equal"):
+        nx.difference(path4, path3)
+    with pytest.raises(nx.NetworkXError, match="Node sets of graphs not equal"):
+        nx.symmetric_difference(path4, path3)
 
 
-def test_symmetric_difference_multigraph():
-    g = nx.MultiGraph()
-    g.add_edge(0, 1, key=0)
-    g.add_edge(0, 1, key=1)
-    g.add_edge(0, 1, key=2)
-    h = nx.MultiGraph()
-    h.add_edge(0, 1, key=0)
-    h.add_edge(0, 1, key=3)
+def test_symmetric_difference_multigraph(base_multi_graph, other_multi_graph):
+    g = base_multi_graph
+    h = other_multi_graph
     gh = nx.symmetric_difference(g, h)
     assert set(gh.nodes()) == set(g.nodes())
     assert set(gh.nodes()) == set(h.nodes())
-    assert sorted(gh.edges()) == 3 * [(0, 1)]
-    assert sorted(sorted(e) for e in gh.edges(keys=True)) == [
-        [0, 1, 1],
-        [0, 1, 2],
-        [0, 1, 3],
-    ]
-
+    assert Counter(gh.edges()) == Counter(3 * [(0, 1)])
+    assert {tuple(sorted(e)) for e in gh.edges(keys=True)} == {
+        (0, 1, 1),
+        (0, 1, 2),
+        (0, 1, 3),
+    }
 
-def test_union_and_compose():
-    K3 = nx.complete_graph(3)
-    P3 = nx.path_graph(3)
 
+def test_union_and_compose(k3, path3):
     G1 = nx.DiGraph()
     G1.add_edge("A", "B")
     G1.add_edge("A", "C")
@@ -262,7 +272,8 @@ def test_union_and_compose():
     H = nx.compose(G1, G2)
     assert edges_equal(G.edges(), H.edges())
     assert not G.has_edge("A", 1)
-    pytest.raises(nx.NetworkXError, nx.union, K3, P3)
+    with pytest.raises(nx.NetworkXError, match="not disjoint"):
+        nx.union(k3, path3)
     H1 = nx.union(H, G1, rename=("H", "G1"))
     assert sorted(H1.nodes()) == [
         "G1A",
@@ -340,8 +351,8 @@ def test_union_multigraph():
     H.add_edge(3, 4, key=0)
     H.add_edge(3, 4, key=1)
     GH = nx.union(G, H)
-    assert set(GH) == set(G) | set(H)
-    assert set(GH.edges(keys=True)) == set(G.edges(keys=True)) | set(H.edges(keys=True))
+    assert set(GH) == G.nodes | H.nodes
+    assert set(GH.edges(keys=True)) == G.edges(keys=True) | H.edges(keys=True)
 
 
 def test_disjoint_union_multigraph():
@@ -352,8 +363,8 @@ def test_disjoint_union_multigraph():
     H.add_edge(2, 3, key=0)
     H.add_edge(2, 3, key=1)
     GH = nx.disjoint_union(G, H)
-    assert set(GH) == set(G) | set(H)
-    assert set(GH.edges(keys=True)) == set(G.edges(keys=True)) | set(H.edges(keys=True))
+    assert set(GH) == G.nodes | H.nodes
+    assert set(GH.edges(keys=True)) == G.edges(keys=True) | H.edges(keys=True)
 
 
 def test_compose_multigraph():
@@ -364,34 +375,43 @@ def test_compose_multigraph():
     H.add_edge(3, 4, key=0)
     H.add_edge(3, 4, key=1)
     GH = nx.compose(G, H)
-    assert set(GH) == set(G) | set(H)
-    assert set(GH.edges(keys=True)) == set(G.edges(keys=True)) | set(H.edges(keys=True))
+    assert set(GH) == G.nodes | H.nodes
+    assert set(GH.edges(keys=True)) == G.edges(keys=True) | H.edges(keys=True)
     H.add_edge(1, 2, key=2)
     GH = nx.compose(G, H)
-    assert set(GH) == set(G) | set(H)
-    assert set(GH.edges(keys=True)) == set(G.edges(keys=True)) | set(H.edges(keys=True))
-
-
-def test_full_join_graph():
-    # Simple Graphs
-    G = nx.Graph()
+    assert set(GH) == G.nodes | H.nodes
+    assert set(GH.edges(keys=True)) == G.edges(keys=True) | H.edges(keys=True)
+
+
+@pytest.mark.parametrize(
+    "graph_type", [nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph]
+)
+@pytest.mark.parametrize(
+    ("rename", "nodes"),
+    [
+        ((None, None), {0, 1, 2, 3, 4}),
+        (("g", "h"), {"g0", "g1", "g2", "h3", "h4"}),
+    ],
+)
+def test_full_join_graph(graph_type, rename, nodes):
+    G = graph_type()
     G.add_node(0)
     G.add_edge(1, 2)
-    H = nx.Graph()
+    H = graph_type()
     H.add_edge(3, 4)
 
-    U = nx.full_join(G, H)
-    assert set(U) == set(G) | set(H)
+    U = nx.full_join(G, H, rename=rename)
+    assert set(U) == nodes
     assert len(U) == len(G) + len(H)
-    assert len(U.edges()) == len(G.edges()) + len(H.edges()) + len(G) * len(H)
+    # directed graphs get the joining edges in both directions
+    join_factor = 2 if G.is_directed() else 1
+    assert (
+        len(U.edges())
+        == len(G.edges()) + len(H.edges()) + len(G) * len(H) * join_factor
+    )
 
-    # Rename
-    U = nx.full_join(G, H, rename=("g", "h"))
-    assert set(U) == {"g0", "g1", "g2", "h3", "h4"}
-    assert len(U) == len(G) + len(H)
-    assert len(U.edges()) == len(G.edges()) + len(H.edges()) + len(G) * len(H)
 
-    # Rename graphs with string-like nodes
+def test_full_join_graph_rename_string_nodes():
     G = nx.Graph()
     G.add_node("a")
     G.add_edge("b", "c")
@@ -403,69 +423,20 @@ def test_full_join_graph():
     assert len(U) == len(G) + len(H)
     assert len(U.edges()) == len(G.edges()) + len(H.edges()) + len(G) * len(H)
 
-    # DiGraphs
-    G = nx.DiGraph()
-    G.add_node(0)
-    G.add_edge(1, 2)
-    H = nx.DiGraph()
-    H.add_edge(3, 4)
-
-    U = nx.full_join(G, H)
-    assert set(U) == set(G) | set(H)
-    assert len(U) == len(G) + len(H)
-    assert len(U.edges()) == len(G.edges()) + len(H.edges()) + len(G) * len(H) * 2
-
-    # DiGraphs Rename
-    U = nx.full_join(G, H, rename=("g", "h"))
-    assert set(U) == {"g0", "g1", "g2", "h3", "h4"}
-    assert len(U) == len(G) + len(H)
-    assert len(U.edges()) == len(G.edges()) + len(H.edges()) + len(G) * len(H) * 2
-
-
-def test_full_join_multigraph():
-    # MultiGraphs
-    G = nx.MultiGraph()
-    G.add_node(0)
-    G.add_edge(1, 2)
-    H = nx.MultiGraph()
-    H.add_edge(3, 4)
-
-    U = nx.full_join(G, H)
-    assert set(U) == set(G) | set(H)
-    assert len(U) == len(G) + len(H)
-    assert len(U.edges()) == len(G.edges()) + len(H.edges()) + len(G) * len(H)
-
-    # MultiGraphs rename
-    U = nx.full_join(G, H, rename=("g", "h"))
-    assert set(U) == {"g0", "g1", "g2", "h3", "h4"}
-    assert len(U) == len(G) + len(H)
-    assert len(U.edges()) == len(G.edges()) + len(H.edges()) + len(G) * len(H)
-
-    # MultiDiGraphs
-    G = nx.MultiDiGraph()
-    G.add_node(0)
-    G.add_edge(1, 2)
-    H = nx.MultiDiGraph()
-    H.add_edge(3, 4)
-
-    U = nx.full_join(G, H)
-    assert set(U) == set(G) | set(H)
-    assert len(U) == len(G) + len(H)
-    assert len(U.edges()) == len(G.edges()) + len(H.edges()) + len(G) * len(H) * 2
-
-    # MultiDiGraphs rename
-    U = nx.full_join(G, H, rename=("g", "h"))
-    assert set(U) == {"g0", "g1", "g2", "h3", "h4"}
-    assert len(U) == len(G) + len(H)
-    assert len(U.edges()) == len(G.edges()) + len(H.edges()) + len(G) * len(H) * 2
-
 
-def test_mixed_type_union():
+@pytest.mark.parametrize(
+    "op",
+    [
+        nx.union,
+        nx.disjoint_union,
+        nx.intersection,
+        nx.difference,
+        nx.symmetric_difference,
+        nx.compose,
+    ],
+)
+def test_mixed_type_union(op):
     G = nx.Graph()
     H = nx.MultiGraph()
-    pytest.raises(nx.NetworkXError, nx.union, G, H)
-    pytest.raises(nx.NetworkXError, nx.disjoint_union, G, H)
-    pytest.raises(nx.NetworkXError, nx.intersection, G, H)
-    pytest.raises(nx.NetworkXError, nx.difference, G, H)
-    pytest.raises(nx.NetworkXError, nx.symmetric_difference, G, H)
-    pytest.raises(nx.NetworkXError, nx.compose, G, H)
+    with pytest.raises(nx.NetworkXError, match="graphs or multigraphs"):
+        op(G, H)
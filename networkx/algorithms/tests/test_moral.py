@@ -13,3 +13,12 @@ def test_get_moral_graph():
     assert H.has_edge(6, 7)
     assert H.has_edge(4, 7)
     assert not H.has_edge(1, 5)
+
+
+def test_moral_graph_existing_edges():
+    G = nx.DiGraph()
+    G.add_edge(1, 2, weight=5)
+    G.add_edges_from([(1, 3), (2, 3), (1, 4), (2, 4)])
+    H = moral_graph(G)
+    assert set(H.edges) == {(1, 2), (1, 3), (1, 4), (2, 3), (2, 4)}
+    assert H[1][2] == {"weight": 5}
@@ -130,6 +130,14 @@ def test_triad_type():
     assert nx.triad_type(G) == "300"
 
 
+def test_triad_type_node_order():
+    """The triad type does not depend on how the nodes are labeled."""
+    G = nx.DiGraph([(0, 1), (1, 0), (0, 2), (2, 1)])
+    for perm in itertools.permutations(range(3)):
+        H = nx.relabel_nodes(G, dict(zip(range(3), perm)))
+        assert nx.triad_type(H) == "120C"
+
+
 def test_triads_by_type():
     """Tests the all_triplets function."""
     G = nx.DiGraph()
@@ -147,6 +155,15 @@ def test_triads_by_type():
             assert any(nx.is_isomorphic(a, e) for e in expected_Gs)
 
 
+def test_triads_by_type_selfloops():
+    """A self-loop makes the triads containing it invalid."""
+    G = nx.DiGraph([(0, 1), (1, 2), (2, 2), (2, 0)])
+    with pytest.raises(nx.NetworkXAlgorithmError):
+        nx.triads_by_type(G)
+    # Too few nodes to form a triad, so there is nothing to reject.
+    assert nx.triads_by_type(nx.DiGraph([(0, 0), (0, 1)])) == {}
+
+
 def test_random_triad():
     """Tests the random_triad function"""
     G = nx.karate_club_graph()
@@ -459,7 +459,7 @@ def bfs_layers(G, sources):
         sources = [sources]
 
     current_layer = list(sources)
-    visited = set(sources)
+    visited = set(current_layer)
 
     for source in current_layer:
         if source not in G:
@@ -467,11 +467,12 @@ def bfs_layers(G, sources):
 
     # this is basically BFS, except that the current layer only stores the nodes at
     # same distance from sources at each iteration
+    adj = G._adj
     while current_layer:
         yield current_layer
         next_layer = []
         for node in current_layer:
-            for child in G[node]:
+            for child in adj[node]:
                 if child not in visited:
                     visited.add(child)
                     next_layer.append(child)
@@ -540,22 +541,22 @@ def bfs_labeled_edges(G, sources):
     queue = deque(depth.items())
     push = queue.append
     pop = queue.popleft
+    get_depth = depth.get
     while queue:
         u, du = pop()
         for v in neighbors[u]:
-            if v not in depth:
+            dv = get_depth(v)
+            if dv is None:
                 depth[v] = dv = du + 1
                 push((v, dv))
                 yield u, v, TREE_EDGE
-            else:
-                dv = depth[v]
-                if du == dv:
-                    if v not in visited:
-                        yield u, v, LEVEL_EDGE
-                elif du < dv:
-                    yield u, v, FORWARD_EDGE
-                elif directed:
-                    yield u, v, REVERSE_EDGE
+            elif du == dv:
+                if v not in visited:
+                    yield u, v, LEVEL_EDGE
+            elif du < dv:
+                yield u, v, FORWARD_EDGE
+            elif directed:
+                yield u, v, REVERSE_EDGE
         visit(u)
 
 
@@ -592,8 +593,16 @@ def descendants_at_distance(G, source, distance):
     if source not in G:
         raise nx.NetworkXError(f"The node {source} is not in the graph.")
 
-    bfs_generator = nx.bfs_layers(G, source)
-    for i, layer in enumerate(bfs_generator):
-        if i == distance:
-            return set(layer)
-    return set()
+    # Only the last layer is needed, so grow unordered frontiers with set
+    # operations instead of building the ordered layers of bfs_layers.
+    # Count depths rather than using range(distance) so that integral floats
+    # such as 2.0 still work; other distances match no layer.
+    adj = G._adj
+    current_layer = {source}
+    visited = {source}
+    depth = 0
+    while depth < distance and current_layer:
+        current_layer = set().union(*(adj[node] for node in current_layer)) - visited
+        visited |= current_layer
+        depth += 1
+    return current_layer if depth == distance else set()
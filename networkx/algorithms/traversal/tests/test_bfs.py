@@ -60,6 +60,7 @@ class TestBFS:
         }
         assert dict(enumerate(nx.bfs_layers(self.G, sources=[0]))) == expected
         assert dict(enumerate(nx.bfs_layers(self.G, sources=0))) == expected
+        assert dict(enumerate(nx.bfs_layers(self.G, sources=iter([0])))) == expected
 
     def test_bfs_layers_missing_source(self):
         with pytest.raises(nx.NetworkXError):
@@ -71,6 +72,17 @@ class TestBFS:
         for distance, descendants in enumerate([{0}, {1}, {2, 3}, {4}]):
             assert nx.descendants_at_distance(self.G, 0, distance) == descendants
 
+    @pytest.mark.parametrize("distance", [-1, 4, 100])
+    def test_descendants_at_distance_out_of_range(self, distance):
+        assert nx.descendants_at_distance(self.G, 0, distance) == set()
+
+    def test_descendants_at_distance_integral_float(self):
+        assert nx.descendants_at_distance(self.G, 0, 2.0) == {2, 3}
+
+    @pytest.mark.parametrize("distance", [1.5, float("inf")])
+    def test_descendants_at_distance_non_integral(self, distance):
+        assert nx.descendants_at_distance(self.G, 0, distance) == set()
+
     def test_descendants_at_distance_missing_source(self):
         with pytest.raises(nx.NetworkXError):
             nx.descendants_at_distance(self.G, "abc", 0)
@@ -8,10 +8,9 @@ from heapq import heappop, heappush
 from itertools import count
 from math import isnan
 from operator import itemgetter
-from queue import PriorityQueue
 
 import networkx as nx
-from networkx.utils import UnionFind, not_implemented_for, py_random_state
+from networkx.utils import not_implemented_for, py_random_state
 
 __all__ = [
     "minimum_spanning_edges",
@@ -41,6 +40,32 @@ class EdgePartition(Enum):
     EXCLUDED = 2
 
 
+def _union_find(nodes):
+    """Returns ``find`` and ``union`` functions of a union-find on `nodes`.
+
+    This is a leaner version of :class:`~networkx.utils.UnionFind` for the
+    inner loops of Kruskal's and Borůvka's algorithms, which spend most of
+    their time in union-find. ``find(x)`` returns the root of the set holding
+    `x`, halving the path on the way. ``union(root1, root2)`` merges the sets
+    of two distinct roots, attaching the smaller set to the larger one.
+    """
+    parent = {n: n for n in nodes}
+    size = dict.fromkeys(parent, 1)
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = x = parent[parent[x]]
+        return x
+
+    def union(root1, root2):
+        if size[root1] < size[root2]:
+            root1, root2 = root2, root1
+        parent[root2] = root1
+        size[root1] += size[root2]
+
+    return find, union
+
+
 @not_implemented_for("multigraph")
 @nx._dispatchable(edge_attrs="weight", preserve_edge_attrs="data")
 def boruvka_mst_edges(
@@ -77,66 +102,61 @@ def boruvka_mst_edges(
     """
     # Initialize a forest, assuming initially that it is the discrete
     # partition of the nodes of the graph.
-    forest = UnionFind(G)
-
-    def best_edge(component):
-        """Returns the optimum (minimum or maximum) edge on the edge
-        boundary of the given set of nodes.
-
-        A return value of ``None`` indicates an empty boundary.
+    find, union = _union_find(G)
 
-        """
-        sign = 1 if minimum else -1
-        minwt = float("inf")
-        boundary = None
-        for e in nx.edge_boundary(G, component, data=True):
-            wt = e[-1].get(weight, 1) * sign
-            if isnan(wt):
-                if ignore_nan:
-                    continue
-                msg = f"NaN found as an edge weight. Edge {e}"
-                raise ValueError(msg)
-            if wt < minwt:
-                minwt = wt
-                boundary = e
-        return boundary
-
-    # Determine the optimum edge in the edge boundary of each component
-    # in the forest.
-    best_edges = (best_edge(component) for component in forest.to_sets())
-    best_edges = [edge for edge in best_edges if edge is not None]
-    # If each entry was ``None``, that means the graph was disconnected,
-    # so we are done generating the forest.
-    while best_edges:
-        # Determine the optimum edge in the edge boundary of each
-        # component in the forest.
-        #
-        # This must be a sequence, not an iterator. In this list, the
-        # same edge may appear twice, in different orientations (but
-        # that's okay, since a union operation will be called on the
-        # endpoints the first time it is seen, but not the second time).
-        #
-        # Any ``None`` indicates that the edge boundary for that
-        # component was empty, so that part of the forest has been
-        # completed.
-        #
-        # TODO This can be parallelized, both in the outer loop over
-        # each component in the forest and in the computation of the
-        # minimum. (Same goes for the identical lines outside the loop.)
-        best_edges = (best_edge(component) for component in forest.to_sets())
-        best_edges = [edge for edge in best_edges if edge is not None]
+    # Collect the signed edge weights once. Self-loops are never on the
+    # boundary of a tree, so they are dropped here.
+    sign = 1 if minimum else -1
+    edges = []
+    for u, v, d in G.edges(data=True):
+        if u == v:
+            continue
+        wt = d.get(weight, 1) * sign
+        if isnan(wt):
+            if ignore_nan:
+                continue
+            msg = f"NaN found as an edge weight. Edge {(u, v, d)}"
+            raise ValueError(msg)
+        edges.append((wt, u, v, d))
+
+    while True:
+        # Determine the optimum edge in the edge boundary of each tree in
+        # the forest, with a single pass over the edges. Using ``<`` keeps
+        # the first of several equal-weight edges in this fixed order, so
+        # every tree breaks ties the same way. Edges found inside a tree
+        # stay there, so only boundary edges are kept for the next round.
+        best_edges = {}
+        boundary_edges = []
+        for edge in edges:
+            wt, u, v, _ = edge
+            root_u = find(u)
+            root_v = find(v)
+            if root_u == root_v:
+                continue
+            boundary_edges.append(edge)
+            best = best_edges.get(root_u)
+            if best is None or wt < best[0]:
+                best_edges[root_u] = edge
+            best = best_edges.get(root_v)
+            if best is None or wt < best[0]:
+                best_edges[root_v] = edge
+        # If no tree has a boundary edge left, the forest is complete.
+        if not best_edges:
+            return
+        edges = boundary_edges
         # Join trees in the forest using the best edges, and yield that
-        # edge, since it is part of the spanning tree.
-        #
-        # TODO This loop can be parallelized, to an extent (the union
-        # operation must be atomic).
-        for u, v, d in best_edges:
-            if forest[u] != forest[v]:
+        # edge, since it is part of the spanning tree. The same edge may
+        # be the best edge of both trees it joins; the union operation is
+        # only done the first time it is seen.
+        for _, u, v, d in best_edges.values():
+            root_u = find(u)
+            root_v = find(v)
+            if root_u != root_v:
                 if data:
                     yield u, v, d
                 else:
                     yield u, v
-                forest.union(u, v)
+                union(root_u, root_v)
 
 
 @nx._dispatchable(
@@ -185,7 +205,7 @@ def kruskal_mst_edges(
         take the following forms: `(u, v)`, `(u, v, d)` or `(u, v, k, d)`
         depending on the `key` and `data` parameters
     """
-    subtrees = UnionFind()
+    find, union = _union_find(G)
     if G.is_multigraph():
         edges = G.edges(keys=True, data=True)
     else:
@@ -227,10 +247,16 @@ def kruskal_mst_edges(
     sorted_edges = included_edges
     del open_edges, sorted_open_edges, included_edges
 
+    # A spanning tree has len(G) - 1 edges. Once that many are found every
+    # remaining edge would close a cycle, so there is no need to scan them.
+    edges_left = len(G) - 1
+
     # Multigraphs need to handle edge keys in addition to edge data.
     if G.is_multigraph():
         for wt, u, v, k, d in sorted_edges:
-            if subtrees[u] != subtrees[v]:
+            root_u = find(u)
+            root_v = find(v)
+            if root_u != root_v:
                 if keys:
                     if data:
                         yield u, v, k, d
@@ -241,15 +267,23 @@ def kruskal_mst_edges(
                         yield u, v, d
                     else:
                         yield u, v
-                subtrees.union(u, v)
+                union(root_u, root_v)
+                edges_left -= 1
+                if edges_left == 0:
+                    return
     else:
         for wt, u, v, d in sorted_edges:
-            if subtrees[u] != subtrees[v]:
+            root_u = find(u)
+            root_v = find(v)
+            if root_u != root_v:
                 if data:
                     yield u, v, d
                 else:
                     yield u, v
-                subtrees.union(u, v)
+                union(root_u, root_v)
+                edges_left -= 1
+                if edges_left == 0:
+                    return
 
 
 @nx._dispatchable(edge_attrs="weight", preserve_edge_attrs="data")
@@ -286,7 +320,9 @@ def prim_mst_edges(G, minimum, weight="weight", keys=True, data=True, ignore_nan
     pop = heappop
 
     nodes = set(G)
+    adj = G._adj
     c = count()
+    counter = c.__next__
 
     sign = 1 if minimum else -1
 
@@ -294,8 +330,12 @@ def prim_mst_edges(G, minimum, weight="weight", keys=True, data=True, ignore_nan
         u = nodes.pop()
         frontier = []
         visited = {u}
+        # Lightest weight pushed so far for each node outside the tree. An
+        # edge that is not lighter can never be popped before the node is
+        # reached, so it is not pushed at all.
+        best = {}
         if is_multigraph:
-            for v, keydict in G.adj[u].items():
+            for v, keydict in adj[u].items():
                 for k, d in keydict.items():
                     wt = d.get(weight, 1) * sign
                     if isnan(wt):
@@ -303,16 +343,21 @@ def prim_mst_edges(G, minimum, weight="weight", keys=True, data=True, ignore_nan
                             continue
                         msg = f"NaN found as an edge weight. Edge {(u, v, k, d)}"
                         raise ValueError(msg)
-                    push(frontier, (wt, next(c), u, v, k, d))
+                    best_wt = best.get(v)
+                    if best_wt is not None and best_wt <= wt:
+                        continue
+                    best[v] = wt
+                    push(frontier, (wt, counter(), u, v, k, d))
         else:
-            for v, d in G.adj[u].items():
+            for v, d in adj[u].items():
                 wt = d.get(weight, 1) * sign
                 if isnan(wt):
                     if ignore_nan:
                         continue
                     msg = f"NaN found as an edge weight. Edge {(u, v, d)}"
                     raise ValueError(msg)
-                push(frontier, (wt, next(c), u, v, d))
+                best[v] = wt
+                push(frontier, (wt, counter(), u, v, d))
         while nodes and frontier:
             if is_multigraph:
                 W, _, u, v, k, d = pop(frontier)
@@ -335,7 +380,7 @@ def prim_mst_edges(G, minimum, weight="weight", keys=True, data=True, ignore_nan
             visited.add(v)
             nodes.discard(v)
             if is_multigraph:
-                for w, keydict in G.adj[v].items():
+                for w, keydict in adj[v].items():
                     if w in visited:
                         continue
                     for k2, d2 in keydict.items():
@@ -345,9 +390,13 @@ def prim_mst_edges(G, minimum, weight="weight", keys=True, data=True, ignore_nan
                                 continue
                             msg = f"NaN found as an edge weight. Edge {(v, w, k2, d2)}"
                             raise ValueError(msg)
-                        push(frontier, (new_weight, next(c), v, w, k2, d2))
+                        best_wt = best.get(w)
+                        if best_wt is not None and best_wt <= new_weight:
+                            continue
+                        best[w] = new_weight
+                        push(frontier, (new_weight, counter(), v, w, k2, d2))
             else:
-                for w, d2 in G.adj[v].items():
+                for w, d2 in adj[v].items():
                     if w in visited:
                         continue
                     new_weight = d2.get(weight, 1) * sign
@@ -356,7 +405,11 @@ def prim_mst_edges(G, minimum, weight="weight", keys=True, data=True, ignore_nan
                             continue
                         msg = f"NaN found as an edge weight. Edge {(v, w, d2)}"
                         raise ValueError(msg)
-                    push(frontier, (new_weight, next(c), v, w, d2))
+                    best_wt = best.get(w)
+                    if best_wt is not None and best_wt <= new_weight:
+                        continue
+                    best[w] = new_weight
+                    push(frontier, (new_weight, counter(), v, w, d2))
 
 
 ALGORITHMS = {
@@ -1031,7 +1084,7 @@ class SpanningTreeIterator:
         self.weight = weight
         self.minimum = minimum
         self.ignore_nan = ignore_nan
-        # Randomly create a key for an edge attribute to hold the partition data
+        # A fixed key for the edge attribute holding the partition data
         self.partition_key = (
             "SpanningTreeIterators super secret partition attribute name"
         )
@@ -1043,14 +1096,15 @@ class SpanningTreeIterator:
         SpanningTreeIterator
             The iterator object for this graph
         """
-        self.partition_queue = PriorityQueue()
+        self.partition_queue = []
         self._clear_partition(self.G)
         mst_weight = partition_spanning_tree(
             self.G, self.minimum, self.weight, self.partition_key, self.ignore_nan
         ).size(weight=self.weight)
 
-        self.partition_queue.put(
-            self.Partition(mst_weight if self.minimum else -mst_weight, {})
+        heappush(
+            self.partition_queue,
+            self.Partition(mst_weight if self.minimum else -mst_weight, {}),
         )
 
         return self
@@ -1063,11 +1117,11 @@ class SpanningTreeIterator:
             The spanning tree of next greatest weight, which ties broken
             arbitrarily.
         """
-        if self.partition_queue.empty():
+        if not self.partition_queue:
             del self.G, self.partition_queue
             raise StopIteration
 
-        partition = self.partition_queue.get()
+        partition = heappop(self.partition_queue)
         self._write_partition(partition)
         next_tree = partition_spanning_tree(
             self.G, self.minimum, self.weight, self.partition_key, self.ignore_nan
@@ -1111,7 +1165,7 @@ class SpanningTreeIterator:
                 p1_mst_weight = p1_mst.size(weight=self.weight)
                 if nx.is_connected(p1_mst):
                     p1.mst_weight = p1_mst_weight if self.minimum else -p1_mst_weight
-                    self.partition_queue.put(p1.__copy__())
+                    heappush(self.partition_queue, p1.__copy__())
                 p1.partition_dict = p2.partition_dict.copy()
 
     def _write_partition(self, partition):
@@ -5,7 +5,7 @@
 """Functions for analyzing triads of a graph."""
 
 from collections import defaultdict
-from itertools import combinations, permutations
+from itertools import combinations
 
 import networkx as nx
 from networkx.utils import not_implemented_for, py_random_state
@@ -231,9 +231,13 @@ def triadic_census(G, nodelist=None):
     # Initialize the count for each triad to be zero.
     census = {name: 0 for name in TRIAD_NAMES}
     # Main loop over nodes
+    # The tricode bits are computed inline (see _tricode) from the successor
+    # dicts: the (v, u) bits are fixed for the whole loop over w.
+    succ = G._succ
     for v in nodeset:
         vnbrs = nbrs[v]
         dbl_vnbrs = dbl_nbrs[v]
+        vsucc = succ[v]
         if Nnot:
             # set up counts of edges attached to v.
             sgl_unbrs_bdy = sgl_unbrs_out = dbl_unbrs_bdy = dbl_unbrs_out = 0
@@ -241,11 +245,20 @@ def triadic_census(G, nodelist=None):
             if m[u] <= m[v]:
                 continue
             unbrs = nbrs[u]
+            usucc = succ[u]
+            vu_code = (u in vsucc) | (v in usucc) << 1
             neighbors = (vnbrs | unbrs) - {u, v}
             # Count connected triads.
             for w in neighbors:
                 if m[u] < m[w] or (m[v] < m[w] < m[u] and v not in nbrs[w]):
-                    code = _tricode(G, v, u, w)
+                    wsucc = succ[w]
+                    code = (
+                        vu_code
+                        | (w in vsucc) << 2
+                        | (v in wsucc) << 3
+                        | (w in usucc) << 4
+                        | (u in wsucc) << 5
+                    )
                     census[TRICODE_TO_NAME[code]] += 1
 
             # Use a formula for dyadic triads with edge incident to v
@@ -422,6 +435,12 @@ def triads_by_type(G):
     tri_by_type : dict
        Dictionary with triad types as keys and lists of triads as values.
 
+    Raises
+    ------
+    NetworkXAlgorithmError
+        If `G` has at least three nodes and contains a self-loop, since a
+        triad containing a self-loop has no triad type.
+
     Examples
     --------
     >>> G = nx.DiGraph([(1, 2), (1, 3), (2, 3), (3, 1), (5, 6), (5, 4), (6, 7)])
@@ -439,11 +458,12 @@ def triads_by_type(G):
     """
     # num_triads = o * (o - 1) * (o - 2) // 6
     # if num_triads > TRIAD_LIMIT: print(WARNING)
-    all_tri = all_triads(G)
+    if len(G) >= 3 and nx.number_of_selfloops(G):
+        raise nx.NetworkXAlgorithmError("G is not a triad (order-3 DiGraph)")
     tri_by_type = defaultdict(list)
-    for triad in all_tri:
-        name = triad_type(triad)
-        tri_by_type[name].append(triad)
+    for triplet in combinations(G.nodes(), 3):
+        name = TRICODE_TO_NAME[_tricode(G, *triplet)]
+        tri_by_type[name].append(G.subgraph(triplet).copy())
     return tri_by_type
 
 
@@ -500,49 +520,10 @@ def triad_type(G):
     """
     if not is_triad(G):
         raise nx.NetworkXAlgorithmError("G is not a triad (order-3 DiGraph)")
-    num_edges = len(G.edges())
-    if num_edges == 0:
-        return "003"
-    elif num_edges == 1:
-        return "012"
-    elif num_edges == 2:
-        e1, e2 = G.edges()
-        if set(e1) == set(e2):
-            return "102"
-        elif e1[0] == e2[0]:
-            return "021D"
-        elif e1[1] == e2[1]:
-            return "021U"
-        elif e1[1] == e2[0] or e2[1] == e1[0]:
-            return "021C"
-    elif num_edges == 3:
-        for e1, e2, e3 in permutations(G.edges(), 3):
-            if set(e1) == set(e2):
-                if e3[0] in e1:
-                    return "111U"
-                # e3[1] in e1:
-                return "111D"
-            elif set(e1).symmetric_difference(set(e2)) == set(e3):
-                if {e1[0], e2[0], e3[0]} == {e1[0], e2[0], e3[0]} == set(G.nodes()):
-                    return "030C"
-                # e3 == (e1[0], e2[1]) and e2 == (e1[1], e3[1]):
-                return "030T"
-    elif num_edges == 4:
-        for e1, e2, e3, e4 in permutations(G.edges(), 4):
-            if set(e1) == set(e2):
-                # identify pair of symmetric edges (which necessarily exists)
-                if set(e3) == set(e4):
-                    return "201"
-                if {e3[0]} == {e4[0]} == set(e3).intersection(set(e4)):
-                    return "120D"
-                if {e3[1]} == {e4[1]} == set(e3).intersection(set(e4)):
-                    return "120U"
-                if e3[1] == e4[0]:
-                    return "120C"
-    elif num_edges == 5:
-        return "210"
-    elif num_edges == 6:
-        return "300"
+    # The tricode depends on the order of the nodes, but every ordering maps
+    # to the same triad name in TRICODE_TO_NAME.
+    v, u, w = G
+    return TRICODE_TO_NAME[_tricode(G, v, u, w)]
 
 
 @not_implemented_for("undirected")